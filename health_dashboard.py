@@ -8,7 +8,11 @@ import os
 import sys
 import json
 import time
-from datetime import datetime
+import heapq
+import threading
+import functools
+import re
+from operator import itemgetter
 from pathlib import Path
 import click
 import psutil
@@ -21,7 +25,52 @@ from rich.layout import Layout
 # Initialize rich console
 console = Console()
 
+# Kernel constants used when parsing /proc/<pid>/stat
+CLK_TCK = os.sysconf('SC_CLK_TCK') if hasattr(os, 'sysconf') else 100
+PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+CPU0_FREQ_PATH = '/sys/devices/system/cpu/cpu0/cpufreq/scaling_cur_freq'
+
+# Pseudo/virtual filesystems that are never worth a statvfs() call
+SKIP_FS = {'squashfs', 'tmpfs', 'devtmpfs', 'overlay', 'proc', 'sysfs', 'cgroup', 'cgroup2', 'fuse'}
+
+def is_skipped_fs(fstype):
+    """Whether a filesystem type is virtual or remote and should not be polled"""
+    # fuse.* covers sshfs, rclone etc.; fuseblk (local NTFS/exFAT disks) is kept
+    return fstype in SKIP_FS or fstype.startswith('fuse.')
+
+# Mounts rarely change, so only re-list partitions every N disk refreshes
+PARTITION_REFRESH_TICKS = 30
+
+def read_small_file(path, size=4096, dir_fd=None):
+    """Read a small file with raw os calls, skipping Python's buffered file objects"""
+    fd = os.open(path, os.O_RDONLY, dir_fd=dir_fd)
+    try:
+        return os.read(fd, size)
+    finally:
+        os.close(fd)
+
+@functools.lru_cache(maxsize=None)
+def detect_os():
+    """Detect the OS name and whether it is CachyOS (cached for the process lifetime)"""
+    import platform
+    
+    try:
+        os_info = read_small_file('/etc/os-release')
+    except OSError:
+        return platform.system(), False
+    
+    if re.search(rb'^ID=.*cachyos', os_info, re.M | re.I):
+        return "CachyOS Linux", True
+    return platform.system(), False
+
 class SystemMonitor:
+    _BAR_FULL = "#" * 64
+    _BAR_EMPTY = "-" * 64
+    _BAR_COLORS = ("green", "yellow", "red")
+    
     def __init__(self):
         self.config_dir = Path.home() / '.config' / 'health-dashboard'
         self.data_dir = Path.home() / '.local' / 'share' / 'health-dashboard'
@@ -36,6 +85,26 @@ class SystemMonitor:
         
         # Get system info
         self.system_info = self.get_system_info()
+        
+        # Cache values that are fixed after boot so refreshes don't re-query them
+        self._boot_time = self.system_info['boot_time']
+        self._cpu_count = self.system_info['cpu_count']
+        self._total_memory = self.system_info['total_memory']
+        
+        # Last formatted uptime, keyed by elapsed minutes
+        self._uptime_cache = (None, '')
+        
+        # Previous per-PID (start time, CPU ticks) for the /proc process scan
+        self._prev_proc_ticks = {}
+        self._prev_proc_time = None
+        
+        # Cached list of real disk partitions for get_disk_info
+        self._partitions = None
+        self._partition_ticks = 0
+        
+        # Latest snapshot from the background sampler, shared with the render loop
+        self._latest = {}
+        self._lock = threading.Lock()
     
     def load_config(self):
         """Load configuration from file or create default"""
@@ -66,17 +135,7 @@ class SystemMonitor:
         try:
             import platform
             
-            # Detect CachyOS
-            is_cachyos = False
-            os_name = platform.system()
-            try:
-                with open('/etc/os-release', 'r') as f:
-                    os_info = f.read()
-                    if 'cachyos' in os_info.lower():
-                        is_cachyos = True
-                        os_name = "CachyOS Linux"
-            except:
-                pass
+            os_name, is_cachyos = detect_os()
             
             return {
                 'os': os_name,
@@ -84,7 +143,7 @@ class SystemMonitor:
                 'hostname': platform.node(),
                 'cpu_count': psutil.cpu_count(),
                 'total_memory': psutil.virtual_memory().total,
-                'boot_time': datetime.fromtimestamp(psutil.boot_time()),
+                'boot_time': psutil.boot_time(),
                 'is_cachyos': is_cachyos
             }
         except:
@@ -94,43 +153,59 @@ class SystemMonitor:
                 'hostname': 'localhost',
                 'cpu_count': 1,
                 'total_memory': 0,
-                'boot_time': datetime.now(),
+                'boot_time': time.time(),
                 'is_cachyos': False
             }
     
-    def format_bytes(self, bytes_value):
+    @staticmethod
+    def format_bytes(bytes_value: float) -> str:
         """Format bytes to human readable format"""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if bytes_value < 1024.0:
-                return f"{bytes_value:.1f} {unit}"
-            bytes_value /= 1024.0
-        return f"{bytes_value:.1f} PB"
-    
-    def format_uptime(self, boot_time):
-        """Format uptime"""
-        uptime = datetime.now() - boot_time
-        days = uptime.days
-        hours, remainder = divmod(uptime.seconds, 3600)
-        minutes, _ = divmod(remainder, 60)
+        # Each unit is 2**10 of the previous one, so the bit length picks it directly
+        idx = min(max(0, (int(bytes_value).bit_length() - 1) // 10), 5)
+        return f"{bytes_value / (1 << (idx * 10)):.1f} {BYTE_UNITS[idx]}"
+    
+    def format_uptime(self) -> str:
+        """Format uptime since the cached boot time"""
+        # The text only has minute resolution, so reuse it until the minute changes
+        total_minutes = int(time.time() - self._boot_time) // 60
+        if self._uptime_cache[0] == total_minutes:
+            return self._uptime_cache[1]
+        
+        days, remainder = divmod(total_minutes, 1440)
+        hours, minutes = divmod(remainder, 60)
         
         if days > 0:
-            return f"{days}d {hours}h {minutes}m"
+            text = f"{days}d {hours}h {minutes}m"
         elif hours > 0:
-            return f"{hours}h {minutes}m"
+            text = f"{hours}h {minutes}m"
         else:
-            return f"{minutes}m"
+            text = f"{minutes}m"
+        
+        self._uptime_cache = (total_minutes, text)
+        return text
     
-    def get_cpu_info(self):
-        """Get CPU usage and information"""
-        cpu_percent = psutil.cpu_percent(interval=1)
-        cpu_freq = psutil.cpu_freq()
+    def get_cpu_info(self, interval=None):
+        """Get CPU usage and information
+        
+        With interval=None usage is measured since the previous call instead
+        of blocking, which suits the dashboard's refresh loop.
+        """
+        cpu_percent = psutil.cpu_percent(interval=interval)
+        
+        # psutil.cpu_freq() reads and averages every core's sysfs file; cpu0 is
+        # enough for a single displayed number
+        try:
+            frequency = int(read_small_file(CPU0_FREQ_PATH, 64)) / 1000
+        except (OSError, ValueError):
+            cpu_freq = psutil.cpu_freq()
+            frequency = cpu_freq.current if cpu_freq else 0
         load_avg = psutil.getloadavg() if hasattr(psutil, 'getloadavg') else (0, 0, 0)
         
         return {
             'usage_percent': cpu_percent,
-            'frequency': cpu_freq.current if cpu_freq else 0,
+            'frequency': frequency,
             'load_avg': load_avg,
-            'core_count': psutil.cpu_count()
+            'core_count': self._cpu_count
         }
     
     def get_memory_info(self):
@@ -150,8 +225,16 @@ class SystemMonitor:
     
     def get_disk_info(self):
         """Get disk usage information"""
+        if self._partitions is None or self._partition_ticks >= PARTITION_REFRESH_TICKS:
+            self._partitions = [
+                partition for partition in psutil.disk_partitions(all=False)
+                if not is_skipped_fs(partition.fstype)
+            ]
+            self._partition_ticks = 0
+        self._partition_ticks += 1
+        
         disks = []
-        for partition in psutil.disk_partitions():
+        for partition in self._partitions:
             try:
                 usage = psutil.disk_usage(partition.mountpoint)
                 disks.append({
@@ -168,30 +251,146 @@ class SystemMonitor:
     
     def get_top_processes(self, limit=10):
         """Get top processes by CPU usage"""
+        if sys.platform.startswith('linux'):
+            return self._get_top_processes_procfs(limit)
+        
         processes = []
-        for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent']):
+        # psutil>=6.0 no longer checks every cached PID for reuse (an extra
+        # create_time() read per process) on each process_iter() call
+        for proc in psutil.process_iter():
             try:
-                proc_info = proc.info
-                proc_info['cpu_percent'] = proc.cpu_percent()
-                processes.append(proc_info)
+                # oneshot() caches the underlying per-process reads so name,
+                # memory and CPU are all served from a single fetch
+                with proc.oneshot():
+                    processes.append({
+                        'pid': proc.pid,
+                        'name': proc.name(),
+                        'cpu_percent': proc.cpu_percent(),
+                        'memory_percent': proc.memory_percent()
+                    })
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 continue
         
-        processes.sort(key=lambda x: x['cpu_percent'], reverse=True)
-        return processes[:limit]
+        # Bounded heap: O(n log k) instead of sorting every process
+        return heapq.nlargest(limit, processes, key=itemgetter('cpu_percent'))
+    
+    def _get_top_processes_procfs(self, limit):
+        """Get top processes by reading /proc/<pid>/stat directly (Linux only)"""
+        now = time.monotonic()
+        elapsed = now - self._prev_proc_time if self._prev_proc_time else 0
+        # Converts a utime+stime tick delta straight into a CPU percentage
+        tick_scale = 100.0 / (CLK_TCK * elapsed) if elapsed > 0 else 0.0
+        total_memory = self._total_memory or 1
+        
+        # Parallel per-process columns; dicts are only built for the top entries
+        pids = []
+        names = []
+        cpus = []
+        rss_pages = []
+        ticks = {}
+        # Open /proc once and resolve '<pid>/stat' relative to it, so the kernel
+        # doesn't walk the full path for every process
+        proc_fd = os.open('/proc', os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            with os.scandir(proc_fd) as entries:
+                pid_dirs = [entry.name for entry in entries if entry.name.isdigit()]
+            
+            stats = []
+            for entry in pid_dirs:
+                try:
+                    stats.append((entry, read_small_file(f'{entry}/stat', 2048, dir_fd=proc_fd)))
+                except OSError:
+                    continue
+        finally:
+            os.close(proc_fd)
+        
+        for entry, data in stats:
+            # comm may contain spaces and parentheses, so split around the last ')'
+            head, _, rest = data.rpartition(b')')
+            fields = rest.split()
+            pid = int(entry)
+            proc_ticks = int(fields[11]) + int(fields[12])
+            # Start time identifies the process, so a reused PID gets a fresh baseline
+            start_time = fields[19]
+            ticks[pid] = (start_time, proc_ticks)
+            
+            prev = self._prev_proc_ticks.get(pid)
+            if prev is not None and prev[0] == start_time and proc_ticks > prev[1]:
+                cpu_percent = (proc_ticks - prev[1]) * tick_scale
+            else:
+                cpu_percent = 0.0
+            
+            pids.append(pid)
+            names.append(head)
+            cpus.append(cpu_percent)
+            rss_pages.append(fields[21])
+        
+        self._prev_proc_ticks = ticks
+        self._prev_proc_time = now
+        
+        # Bounded heap over indices: O(n log k) instead of sorting every process
+        top = heapq.nlargest(limit, range(len(pids)), key=cpus.__getitem__)
+        return [
+            {
+                'pid': pids[i],
+                'name': names[i][names[i].find(b'(') + 1:].decode(errors='replace'),
+                'cpu_percent': cpus[i],
+                'memory_percent': int(rss_pages[i]) * PAGE_SIZE / total_memory * 100
+            }
+            for i in top
+        ]
     
-    def create_progress_bar(self, percentage, width=30):
+    def take_snapshot(self, include_processes=False, cpu_interval=None):
+        """Collect one reading of every metric shown by the dashboard"""
+        return {
+            'timestamp': time.time(),
+            'cpu': self.get_cpu_info(interval=cpu_interval),
+            'memory': self.get_memory_info(),
+            'disk': self.get_disk_info(),
+            'processes': self.get_top_processes(5) if include_processes else []
+        }
+    
+    def get_latest(self):
+        """Return the most recent snapshot taken by the background sampler
+        
+        Re-raises the exception if the sampler thread failed.
+        """
+        with self._lock:
+            snapshot = self._latest
+        if 'error' in snapshot:
+            raise snapshot['error']
+        return snapshot
+    
+    def start_sampler(self, interval=2, include_processes=False):
+        """Sample metrics on a daemon thread so slow reads never block rendering"""
+        def sample():
+            # psutil keeps the cpu_percent() baseline per thread, so prime it here
+            # to give the first interval a real measurement window
+            psutil.cpu_percent(interval=None)
+            while True:
+                time.sleep(interval)
+                try:
+                    snapshot = self.take_snapshot(include_processes)
+                except Exception as e:
+                    # Hand the error to the render loop instead of dying silently
+                    snapshot = {'error': e}
+                with self._lock:
+                    self._latest = snapshot
+                if 'error' in snapshot:
+                    return
+        
+        # Take the first sample synchronously so there is always something to
+        # render; block briefly so its CPU% covers a meaningful window
+        self._latest = self.take_snapshot(include_processes, cpu_interval=0.5)
+        threading.Thread(target=sample, daemon=True).start()
+    
+    def create_progress_bar(self, percentage: float, width: int = 30) -> str:
         """Create a visual progress bar"""
-        filled = int(width * percentage / 100)
-        bar = "#" * filled + "-" * (width - filled)
-        
-        # Color based on percentage
-        if percentage < 50:
-            color = "green"
-        elif percentage < 80:
-            color = "yellow"
-        else:
-            color = "red"
+        filled = int(width * percentage * 0.01)
+        bar = self._BAR_FULL[:filled] + self._BAR_EMPTY[filled:width]
+        
+        # Color based on percentage: green < 50, yellow < 80, red otherwise
+        color = self._BAR_COLORS[(percentage >= 50) + (percentage >= 80)]
             
         return f"[{color}]{bar}[/{color}] {percentage:.1f}%"
 
@@ -210,103 +409,149 @@ def cli():
 def dashboard(detailed, refresh):
     """Launch real-time system dashboard with smooth updates"""
     
-    def generate_dashboard():
-        """Generate the dashboard layout"""
-        # Header
-        header = "System Health Dashboard"
-        if monitor.system_info['is_cachyos']:
-            header += " - CachyOS Linux"
-        
-        # Create main layout
-        layout = Layout()
-        layout.split_column(
-            Layout(Panel.fit(header, style="bold blue"), name="header", size=3),
-            Layout(name="main"),
-            Layout(name="footer", size=3)
+    # Header
+    header = "System Health Dashboard"
+    if monitor.system_info['is_cachyos']:
+        header += " - CachyOS Linux"
+    
+    # Create main layout once; each refresh only updates the parts that change
+    layout = Layout()
+    layout.split_column(
+        Layout(Panel.fit(header, style="bold blue"), name="header", size=3),
+        Layout(name="main"),
+        Layout(name="footer", size=3)
+    )
+    
+    # Split main into sections
+    if detailed:
+        layout["main"].split_column(
+            Layout(name="cpu_memory"),
+            Layout(name="disk"),
+            Layout(name="processes")
         )
+    else:
+        layout["main"].split_column(
+            Layout(name="cpu_memory"),
+            Layout(name="disk")
+        )
+    
+    # CPU section
+    cpu_section = Table(title="CPU Usage", border_style="blue")
+    cpu_section.add_column("Metric", style="cyan")
+    cpu_section.add_column("Value", style="green")
+    
+    cpu_section.add_row("Usage", "")
+    cpu_section.add_row("Cores", f"{monitor.system_info['cpu_count']}")
+    cpu_section.add_row("Frequency", "")
+    cpu_section.add_row("Load", "")
+    
+    # Memory section
+    memory_section = Table(title="Memory Usage", border_style="blue")
+    memory_section.add_column("Metric", style="cyan")
+    memory_section.add_column("Value", style="green")
+    
+    memory_section.add_row("Usage", "")
+    memory_section.add_row("Used", "")
+    memory_section.add_row("Free", "")
+    memory_section.add_row("Total", monitor.format_bytes(monitor.system_info['total_memory']))
+    
+    # CPU and Memory section
+    cpu_memory_table = Table.grid(padding=2)
+    cpu_memory_table.add_column()
+    cpu_memory_table.add_column()
+    cpu_memory_table.add_row(cpu_section, memory_section)
+    layout["cpu_memory"].update(cpu_memory_table)
+    
+    # Disk section
+    disk_section = Table(title="Disk Usage", border_style="blue")
+    disk_section.add_column("Mount", style="cyan")
+    disk_section.add_column("Usage", style="green")
+    disk_section.add_column("Free", style="yellow")
+    layout["disk"].update(disk_section)
+    
+    # Top Processes section (if detailed)
+    proc_table = Table(title="Top Processes", border_style="blue")
+    proc_table.add_column("PID", style="cyan")
+    proc_table.add_column("Name", style="green")
+    proc_table.add_column("CPU%", style="yellow")
+    proc_table.add_column("RAM%", style="red")
+    if detailed:
+        layout["processes"].update(proc_table)
+    
+    # Footer with alerts and info
+    footer_panel = Panel("", style="dim")
+    layout["footer"].update(footer_panel)
+    
+    def set_value(table, row, value):
+        """Replace a cell in the value column only if its text changed"""
+        cells = table.columns[1]._cells
+        if cells[row] != value:
+            cells[row] = value
+    
+    def set_rows(table, rows):
+        """Write rows into a table in place, only touching cells whose text changed"""
+        if len(table.rows) != len(rows):
+            # Row count changed (e.g. a mount appeared), so refill the table
+            table.rows.clear()
+            for column in table.columns:
+                column._cells.clear()
+            for row in rows:
+                table.add_row(*row)
+            return
         
-        # Split main into sections
-        if detailed:
-            layout["main"].split_column(
-                Layout(name="cpu_memory"),
-                Layout(name="disk"),
-                Layout(name="processes")
-            )
-        else:
-            layout["main"].split_column(
-                Layout(name="cpu_memory"),
-                Layout(name="disk")
-            )
+        for column, values in zip(table.columns, zip(*rows)):
+            cells = column._cells
+            for i, value in enumerate(values):
+                if cells[i] != value:
+                    cells[i] = value
+    
+    last_snapshot = None
+    
+    def update_dashboard():
+        """Refresh the dashboard layout from the latest sampler snapshot
+        
+        Returns False when no new snapshot has arrived since the last call.
+        """
+        nonlocal last_snapshot
+        snapshot = monitor.get_latest()
+        if snapshot is last_snapshot:
+            return False
+        last_snapshot = snapshot
+        
+        cpu_info = snapshot['cpu']
+        memory_info = snapshot['memory']
+        disk_info = snapshot['disk']
+        
+        set_value(cpu_section, 0, monitor.create_progress_bar(cpu_info['usage_percent']))
+        set_value(cpu_section, 2, f"{cpu_info['frequency']:.0f} MHz")
+        set_value(cpu_section, 3, f"{cpu_info['load_avg'][0]:.2f}")
+        
+        set_value(memory_section, 0, monitor.create_progress_bar(memory_info['percent']))
+        set_value(memory_section, 1, monitor.format_bytes(memory_info['used']))
+        set_value(memory_section, 2, monitor.format_bytes(memory_info['free']))
         
-        # Get all system info
-        cpu_info = monitor.get_cpu_info()
-        memory_info = monitor.get_memory_info()
-        disk_info = monitor.get_disk_info()
-        
-        # CPU and Memory section
-        cpu_memory_table = Table.grid(padding=2)
-        cpu_memory_table.add_column()
-        cpu_memory_table.add_column()
-        
-        # CPU section
-        cpu_section = Table(title="CPU Usage", border_style="blue")
-        cpu_section.add_column("Metric", style="cyan")
-        cpu_section.add_column("Value", style="green")
-        
-        cpu_section.add_row("Usage", monitor.create_progress_bar(cpu_info['usage_percent']))
-        cpu_section.add_row("Cores", f"{cpu_info['core_count']}")
-        cpu_section.add_row("Frequency", f"{cpu_info['frequency']:.0f} MHz")
-        cpu_section.add_row("Load", f"{cpu_info['load_avg'][0]:.2f}")
-        
-        # Memory section
-        memory_section = Table(title="Memory Usage", border_style="blue")
-        memory_section.add_column("Metric", style="cyan")
-        memory_section.add_column("Value", style="green")
-        
-        memory_section.add_row("Usage", monitor.create_progress_bar(memory_info['percent']))
-        memory_section.add_row("Used", f"{monitor.format_bytes(memory_info['used'])}")
-        memory_section.add_row("Free", f"{monitor.format_bytes(memory_info['free'])}")
-        memory_section.add_row("Total", f"{monitor.format_bytes(memory_info['total'])}")
-        
-        cpu_memory_table.add_row(cpu_section, memory_section)
-        layout["cpu_memory"].update(cpu_memory_table)
-        
-        # Disk section
-        disk_section = Table(title="Disk Usage", border_style="blue")
-        disk_section.add_column("Mount", style="cyan")
-        disk_section.add_column("Usage", style="green")
-        disk_section.add_column("Free", style="yellow")
-        
-        for disk in disk_info[:3]:
-            disk_section.add_row(
+        set_rows(disk_section, [
+            (
                 disk['mountpoint'],
                 monitor.create_progress_bar(disk['percent']),
                 monitor.format_bytes(disk['free'])
             )
+            for disk in disk_info[:3]
+        ])
         
-        layout["disk"].update(disk_section)
-        
-        # Top Processes section (if detailed)
         if detailed:
-            processes = monitor.get_top_processes(5)
-            proc_table = Table(title="Top Processes", border_style="blue")
-            proc_table.add_column("PID", style="cyan")
-            proc_table.add_column("Name", style="green")
-            proc_table.add_column("CPU%", style="yellow")
-            proc_table.add_column("RAM%", style="red")
-            
-            for proc in processes:
-                proc_table.add_row(
+            set_rows(proc_table, [
+                (
                     str(proc['pid']),
                     proc['name'][:15],
                     f"{proc['cpu_percent']:.1f}",
                     f"{proc['memory_percent']:.1f}"
                 )
-            
-            layout["processes"].update(proc_table)
+                for proc in snapshot['processes']
+            ])
         
         # Footer with alerts and info
-        uptime = monitor.format_uptime(monitor.system_info['boot_time'])
+        uptime = monitor.format_uptime()
         load_avg = cpu_info['load_avg'][0]
         
         # Check for alerts
@@ -317,18 +562,20 @@ def dashboard(detailed, refresh):
             alerts.append(f"Memory usage high ({memory_info['percent']:.1f}% > 85%)")
         
         alert_text = " | ".join(alerts) if alerts else "All systems normal"
-        footer_text = f"Alerts: {alert_text} | Uptime: {uptime} | Load: {load_avg:.1f} | Updated: {datetime.now().strftime('%H:%M:%S')} | Press Ctrl+C to exit"
-        
-        layout["footer"].update(Panel(footer_text, style="dim"))
+        footer_panel.renderable = f"Alerts: {alert_text} | Uptime: {uptime} | Load: {load_avg:.1f} | Updated: {time.strftime('%H:%M:%S', time.localtime(snapshot['timestamp']))} | Press Ctrl+C to exit"
         
-        return layout
+        return True
     
-    # Use Live display for smooth updates
+    # Use Live display, redrawing only when the sampler has published new data
     try:
-        with Live(generate_dashboard(), refresh_per_second=0.5, screen=True) as live:
+        monitor.start_sampler(interval=2, include_processes=detailed)
+        update_dashboard()
+        with Live(layout, auto_refresh=False, screen=True) as live:
+            live.refresh()
             while True:
-                time.sleep(2)
-                live.update(generate_dashboard())
+                time.sleep(0.25)
+                if update_dashboard():
+                    live.refresh()
                 
     except KeyboardInterrupt:
         console.print("\n[yellow]Dashboard stopped[/yellow]")
@@ -339,8 +586,8 @@ def status():
     
     console.print(Panel.fit("System Status", style="bold blue"))
     
-    # Get system info
-    cpu_info = monitor.get_cpu_info()
+    # Get system info (one-off, so sample CPU over a full second)
+    cpu_info = monitor.get_cpu_info(interval=1)
     memory_info = monitor.get_memory_info()
     disk_info = monitor.get_disk_info()
     
@@ -352,7 +599,7 @@ def status():
     sys_table.add_row("Hostname", monitor.system_info['hostname'])
     sys_table.add_row("OS", monitor.system_info['os'])
     sys_table.add_row("Kernel", monitor.system_info['kernel'])
-    sys_table.add_row("Uptime", monitor.format_uptime(monitor.system_info['boot_time']))
+    sys_table.add_row("Uptime", monitor.format_uptime())
     
     if monitor.system_info['is_cachyos']:
         sys_table.add_row("Performance", "CachyOS Optimized")